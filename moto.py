@@ -15,13 +15,33 @@ License: I don't care. Steal this if you want.
 """
 
 import argparse
+import csv
+import io
 import math
 import sys
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Literal, NamedTuple, Optional, TextIO, Tuple, overload
 
+# Unit conversions: RPM -> rad/s and mph -> m/s
+_RPM_TO_RADS: float = 2.0 * math.pi / 60.0
+_MPH_TO_MS: float = 1.60934 / 3.6
 
-@dataclass
+# Perceptibility of the outer vs inner gyro difference (%). A value equal
+# to a threshold falls in the band above it, hence bisect_right.
+_THRESHOLDS = (5.0, 10.0, 20.0)
+_STATUSES = (
+    "✅ NOT PERCEPTIBLE (< 5% threshold)",
+    "⚠️  BARELY PERCEPTIBLE (5-10% range)",
+    "⚠️  POSSIBLY PERCEPTIBLE (10-20% range)",
+    "❌ LIKELY PERCEPTIBLE (> 20%)",
+)
+_SUMMARY_THRESHOLDS = (5.0, 10.0)
+_SUMMARY_LABELS = ("NO", "MAYBE", "YES")
+
+
+@dataclass(slots=True)
 class BikeConfig:
     """Motorcycle configuration parameters"""
     # Flywheel
@@ -37,12 +57,15 @@ class BikeConfig:
     rear_wheel_mass: float = 10  # kg
     rear_wheel_radius: float = 0.30  # m (18" wheel)
     
+    # Derived
+    added_weight_kg: float = field(init=False, default=0.0)  # kg
+    
     def __post_init__(self):
         """Convert ounces to kg"""
         self.added_weight_kg = self.added_weight_oz * 0.0283495
 
 
-@dataclass
+@dataclass(slots=True)
 class RidingCondition:
     """Represents a specific riding scenario"""
     name: str
@@ -51,6 +74,92 @@ class RidingCondition:
     lean_rate_rad_s: float
 
 
+@dataclass(slots=True, frozen=True)
+class WheelGyroResult:
+    """Gyroscopic torques (N⋅m) and spin rates (rad/s) of the wheels"""
+    front: float
+    rear: float
+    total: float
+    omega_front: float
+    omega_rear: float
+
+
+@dataclass(slots=True, frozen=True)
+class EngineGyroResult:
+    """Gyroscopic torque (N⋅m), spin rate (rad/s) and inertia (kg⋅m²) of the flywheel"""
+    torque: float
+    omega: float
+    inertia: float
+
+
+@dataclass(slots=True)
+class SummaryResult:
+    """Minimal analysis results for a riding condition (summary table only)"""
+    condition: RidingCondition
+    net_gyro_outer: float
+    gyro_diff_pct: float
+    
+    @property
+    def perceptible(self) -> str:
+        """Whether the outer vs inner gyro difference can be felt"""
+        return _SUMMARY_LABELS[bisect_right(_SUMMARY_THRESHOLDS, self.gyro_diff_pct)]
+
+
+@dataclass(slots=True)
+class AnalysisResult(SummaryResult):
+    """Complete analysis results for a riding condition"""
+    wheel_data: WheelGyroResult
+    tau_wheels: float
+    engine_stock: EngineGyroResult
+    engine_outer: EngineGyroResult
+    engine_inner: EngineGyroResult
+    net_gyro_stock: float
+    net_gyro_inner: float
+    gyro_diff: float
+    I_stock: float
+    I_outer: float
+    I_inner: float
+    inertia_diff_pct: float
+
+
+class _AnalysisRow(NamedTuple):
+    """Condition-independent AnalysisResult fields, as cached per (speed, rpm, lean rate)"""
+    net_gyro_outer: float
+    gyro_diff_pct: float
+    wheel_data: WheelGyroResult
+    tau_wheels: float
+    engine_stock: EngineGyroResult
+    engine_outer: EngineGyroResult
+    engine_inner: EngineGyroResult
+    net_gyro_stock: float
+    net_gyro_inner: float
+    gyro_diff: float
+    I_stock: float
+    I_outer: float
+    I_inner: float
+    inertia_diff_pct: float
+    
+    def to_result(self, condition: RidingCondition) -> AnalysisResult:
+        """Full AnalysisResult for a condition with this row's values"""
+        return AnalysisResult(
+            condition=condition,
+            net_gyro_outer=self.net_gyro_outer,
+            gyro_diff_pct=self.gyro_diff_pct,
+            wheel_data=self.wheel_data,
+            tau_wheels=self.tau_wheels,
+            engine_stock=self.engine_stock,
+            engine_outer=self.engine_outer,
+            engine_inner=self.engine_inner,
+            net_gyro_stock=self.net_gyro_stock,
+            net_gyro_inner=self.net_gyro_inner,
+            gyro_diff=self.gyro_diff,
+            I_stock=self.I_stock,
+            I_outer=self.I_outer,
+            I_inner=self.I_inner,
+            inertia_diff_pct=self.inertia_diff_pct
+        )
+
+
 class GyroscopicAnalyzer:
     """Analyzes gyroscopic effects and rotational inertia"""
     
@@ -60,6 +169,32 @@ class GyroscopicAnalyzer:
         # Calculate wheel moments of inertia (solid disk approximation)
         self.I_front_wheel = 0.5 * config.front_wheel_mass * config.front_wheel_radius**2
         self.I_rear_wheel = 0.5 * config.rear_wheel_mass * config.rear_wheel_radius**2
+        
+        # Wheel spin rate per unit speed 1/r, and gyro coefficients I/r,
+        # since ω_wheel = v/r
+        self._inv_r_front = 1.0 / config.front_wheel_radius
+        self._inv_r_rear = 1.0 / config.rear_wheel_radius
+        self._k_front = self.I_front_wheel * self._inv_r_front
+        self._k_rear = self.I_rear_wheel * self._inv_r_rear
+        
+        # Flywheel inertias are constant for a config, so compute them once
+        # (stock flywheel simplified as point mass, plus added weight)
+        m, ri, ro, r = (config.added_weight_kg, config.inner_radius,
+                        config.outer_radius, config.flywheel_radius)
+        I0 = config.stock_flywheel_mass * r * r
+        self._I_flywheel = {'stock': I0, 'outer': I0 + m * ro * ro, 'inner': I0 + m * ri * ri}
+        
+        # Inertia comparison (for engine response) is condition-independent
+        self._inertia_diff_pct = ((self._I_flywheel['outer'] - self._I_flywheel['inner'])
+                                  / self._I_flywheel['inner']) * 100
+        
+        # Memoize the analysis rows per analyzer, so a cache hit only has to
+        # attach the condition. The cache assumes the config is not mutated
+        # after construction; build a new analyzer instead. Note that this
+        # makes a reference cycle (analyzer -> cache -> bound method ->
+        # analyzer): an analyzer and its cached rows are only freed by the
+        # cyclic garbage collector, not as soon as the last reference goes.
+        self._analyze_core = lru_cache(maxsize=1024)(self._analyze_core)
     
     def calc_flywheel_inertia(self, weight_position: str = 'stock') -> float:
         """
@@ -71,20 +206,9 @@ class GyroscopicAnalyzer:
         Returns:
             Moment of inertia in kg⋅m²
         """
-        # Stock flywheel (simplified as point mass)
-        I_stock = self.config.stock_flywheel_mass * self.config.flywheel_radius**2
-        
-        # Added weight contribution
-        if weight_position == 'outer':
-            I_added = self.config.added_weight_kg * self.config.outer_radius**2
-        elif weight_position == 'inner':
-            I_added = self.config.added_weight_kg * self.config.inner_radius**2
-        else:  # stock
-            I_added = 0
-        
-        return I_stock + I_added
+        return self._I_flywheel.get(weight_position, self._I_flywheel['stock'])
     
-    def calc_wheel_gyro_torque(self, speed_mph: float, lean_rate_rad_s: float) -> Dict[str, float]:
+    def calc_wheel_gyro_torque(self, speed_mph: float, lean_rate_rad_s: float) -> WheelGyroResult:
         """
         Calculate gyroscopic torque from wheels
         
@@ -93,29 +217,29 @@ class GyroscopicAnalyzer:
             lean_rate_rad_s: Angular velocity of bike lean (rad/s)
         
         Returns:
-            Dictionary with front, rear, and total wheel gyro torques
+            WheelGyroResult with front, rear, and total wheel gyro torques
         """
         # Convert speed to m/s
-        speed_ms = (speed_mph * 1.60934) / 3.6
+        speed_ms = speed_mph * _MPH_TO_MS
         
         # Wheel angular velocities (rad/s)
-        omega_front = speed_ms / self.config.front_wheel_radius
-        omega_rear = speed_ms / self.config.rear_wheel_radius
-        
-        # Gyroscopic torque = I × ω × Ω
-        tau_front = self.I_front_wheel * omega_front * lean_rate_rad_s
-        tau_rear = self.I_rear_wheel * omega_rear * lean_rate_rad_s
-        
-        return {
-            'front': tau_front,
-            'rear': tau_rear,
-            'total': tau_front + tau_rear,
-            'omega_front': omega_front,
-            'omega_rear': omega_rear
-        }
+        omega_front = speed_ms * self._inv_r_front
+        omega_rear = speed_ms * self._inv_r_rear
+        
+        # Gyroscopic torque = I × ω × Ω = (I/r) × v × Ω
+        tau_front = self._k_front * speed_ms * lean_rate_rad_s
+        tau_rear = self._k_rear * speed_ms * lean_rate_rad_s
+        
+        return WheelGyroResult(
+            front=tau_front,
+            rear=tau_rear,
+            total=tau_front + tau_rear,
+            omega_front=omega_front,
+            omega_rear=omega_rear
+        )
     
     def calc_engine_gyro_torque(self, rpm: int, lean_rate_rad_s: float, 
-                                weight_position: str = 'stock') -> Dict[str, float]:
+                                weight_position: str = 'stock') -> EngineGyroResult:
         """
         Calculate gyroscopic torque from engine/flywheel
         
@@ -125,10 +249,10 @@ class GyroscopicAnalyzer:
             weight_position: 'stock', 'outer', or 'inner'
         
         Returns:
-            Dictionary with engine gyro torque and omega
+            EngineGyroResult with engine gyro torque and omega
         """
         # Convert RPM to rad/s
-        omega_engine = (rpm * 2 * math.pi) / 60
+        omega_engine = rpm * _RPM_TO_RADS
         
         # Get flywheel inertia for this configuration
         I_flywheel = self.calc_flywheel_inertia(weight_position)
@@ -136,146 +260,233 @@ class GyroscopicAnalyzer:
         # Gyroscopic torque = I × ω × Ω
         tau_engine = I_flywheel * omega_engine * lean_rate_rad_s
         
-        return {
-            'torque': tau_engine,
-            'omega': omega_engine,
-            'inertia': I_flywheel
-        }
+        return EngineGyroResult(
+            torque=tau_engine,
+            omega=omega_engine,
+            inertia=I_flywheel
+        )
     
-    def analyze_condition(self, condition: RidingCondition) -> Dict:
+    def analyze_condition(self, condition: RidingCondition) -> AnalysisResult:
         """
         Complete analysis for a riding condition
         
+        Repeat calls with the same speed, RPM and lean rate are served from
+        a per-analyzer cache; their results share the (frozen) wheel/engine
+        sub-results.
+        
         Args:
             condition: RidingCondition object
         
         Returns:
-            Dictionary with complete analysis results
+            AnalysisResult with complete analysis results
         """
-        # Wheel gyroscopic torque
-        wheel_data = self.calc_wheel_gyro_torque(condition.speed_mph, condition.lean_rate_rad_s)
-        tau_wheels = wheel_data['total']
+        row = self._analyze_core(condition.speed_mph, condition.rpm, condition.lean_rate_rad_s)
+        return row.to_result(condition)
+    
+    def analyze_condition_minimal(self, condition: RidingCondition) -> SummaryResult:
+        """
+        Summary-only analysis for a riding condition
+        
+        Args:
+            condition: RidingCondition object
         
-        # Engine gyroscopic torque for each configuration
-        engine_stock = self.calc_engine_gyro_torque(condition.rpm, condition.lean_rate_rad_s, 'stock')
-        engine_outer = self.calc_engine_gyro_torque(condition.rpm, condition.lean_rate_rad_s, 'outer')
-        engine_inner = self.calc_engine_gyro_torque(condition.rpm, condition.lean_rate_rad_s, 'inner')
+        Returns:
+            SummaryResult with just the fields the summary table needs
+        """
+        return self.analyze_conditions([condition], full=False)[0]
+    
+    @overload
+    def analyze_conditions(self, conditions: List[RidingCondition],
+                           full: Literal[True] = ...) -> List[AnalysisResult]: ...
+    
+    @overload
+    def analyze_conditions(self, conditions: List[RidingCondition],
+                           full: Literal[False]) -> List[SummaryResult]: ...
+    
+    def analyze_conditions(self, conditions: List[RidingCondition],
+                           full: bool = True) -> List[SummaryResult]:
+        """
+        Analysis for a batch of riding conditions
+        
+        Each condition goes through the analyze_condition cache.
+        
+        Args:
+            conditions: List of RidingCondition objects
+            full: Build complete AnalysisResults; if False, build SummaryResults
+                with just the fields the summary table needs
+        
+        Returns:
+            List of AnalysisResult (or SummaryResult) objects, in order
+        """
+        analyze_core = self._analyze_core
+        rows = [analyze_core(c.speed_mph, c.rpm, c.lean_rate_rad_s) for c in conditions]
+        if full:
+            return [row.to_result(c) for c, row in zip(conditions, rows)]
+        return [SummaryResult(condition=c, net_gyro_outer=row.net_gyro_outer,
+                              gyro_diff_pct=row.gyro_diff_pct)
+                for c, row in zip(conditions, rows)]
+    
+    def sweep_net_gyro(self, rpms: List[float], speeds_mph: List[float],
+                       lean_rate_rad_s: float, weight_position: str = 'outer') -> Iterator[List[float]]:
+        """
+        Net gyroscopic torque over an RPM × speed grid, yielded one RPM row at a time
+        
+        Wheel and engine torques each depend on one axis only, so they are
+        computed once per speed and once per RPM; each grid cell is then a
+        single subtraction.
+        
+        Args:
+            rpms: Engine RPM values (grid rows)
+            speeds_mph: Ground speeds in mph (grid columns)
+            lean_rate_rad_s: Angular velocity of bike lean (rad/s)
+            weight_position: 'stock', 'outer', or 'inner'
+        
+        Yields:
+            Net gyro torque in N⋅m for one RPM, one value per speed
+        """
+        tau_wheels = [self.calc_wheel_gyro_torque(v, lean_rate_rad_s).total for v in speeds_mph]
+        for rpm in rpms:
+            tau_eng = self.calc_engine_gyro_torque(rpm, lean_rate_rad_s, weight_position).torque
+            yield [tau_w - tau_eng for tau_w in tau_wheels]
+    
+    def _analyze_core(self, speed_mph: float, rpm: int, lean_rate_rad_s: float) -> _AnalysisRow:
+        """Analysis row for a single condition (memoized in __init__)"""
+        wheel_data = self.calc_wheel_gyro_torque(speed_mph, lean_rate_rad_s)
+        tau_w = wheel_data.total
+        
+        # All flywheel configs share ω × Ω, so compute it once
+        omega_engine = rpm * _RPM_TO_RADS
+        factor = omega_engine * lean_rate_rad_s
+        I_stock, I_outer, I_inner = (self._I_flywheel['stock'], self._I_flywheel['outer'],
+                                     self._I_flywheel['inner'])
+        tau_stock, tau_outer, tau_inner = I_stock * factor, I_outer * factor, I_inner * factor
         
         # NET gyroscopic torque (wheels MINUS engine - opposite rotation!)
-        net_gyro_stock = tau_wheels - engine_stock['torque']
-        net_gyro_outer = tau_wheels - engine_outer['torque']
-        net_gyro_inner = tau_wheels - engine_inner['torque']
+        net_gyro_outer = tau_w - tau_outer
+        net_gyro_inner = tau_w - tau_inner
         
         # Calculate differences
+        gyro_diff, gyro_diff_pct = self._gyro_difference(net_gyro_outer, net_gyro_inner)
+        
+        return _AnalysisRow(
+            net_gyro_outer=net_gyro_outer,
+            gyro_diff_pct=gyro_diff_pct,
+            wheel_data=wheel_data,
+            tau_wheels=tau_w,
+            engine_stock=EngineGyroResult(tau_stock, omega_engine, I_stock),
+            engine_outer=EngineGyroResult(tau_outer, omega_engine, I_outer),
+            engine_inner=EngineGyroResult(tau_inner, omega_engine, I_inner),
+            net_gyro_stock=tau_w - tau_stock,
+            net_gyro_inner=net_gyro_inner,
+            gyro_diff=gyro_diff,
+            I_stock=I_stock,
+            I_outer=I_outer,
+            I_inner=I_inner,
+            inertia_diff_pct=self._inertia_diff_pct
+        )
+    
+    @staticmethod
+    def _gyro_difference(net_gyro_outer: float, net_gyro_inner: float) -> Tuple[float, float]:
+        """Absolute and percentage net gyro difference, outer vs inner"""
         gyro_diff = abs(net_gyro_outer - net_gyro_inner)
-        gyro_diff_pct = (gyro_diff / abs(net_gyro_inner)) * 100 if net_gyro_inner != 0 else 0
-        
-        # Inertia comparison (for engine response)
-        I_stock = engine_stock['inertia']
-        I_outer = engine_outer['inertia']
-        I_inner = engine_inner['inertia']
-        inertia_diff_pct = ((I_outer - I_inner) / I_inner) * 100
-        
-        return {
-            'condition': condition,
-            'wheel_data': wheel_data,
-            'tau_wheels': tau_wheels,
-            'engine_stock': engine_stock,
-            'engine_outer': engine_outer,
-            'engine_inner': engine_inner,
-            'net_gyro_stock': net_gyro_stock,
-            'net_gyro_outer': net_gyro_outer,
-            'net_gyro_inner': net_gyro_inner,
-            'gyro_diff': gyro_diff,
-            'gyro_diff_pct': gyro_diff_pct,
-            'I_stock': I_stock,
-            'I_outer': I_outer,
-            'I_inner': I_inner,
-            'inertia_diff_pct': inertia_diff_pct
-        }
+        # Branch-free divide-by-zero guard: the 1e-300 epsilon is far below
+        # double precision for any physical torque, so it does not change
+        # non-zero results, and 0/0 gives 0%. Unlike the old branch, an
+        # exactly-zero inner net gyro with a non-zero difference now gives
+        # a huge percentage (~1e302%, "YES") instead of 0% ("NO").
+        gyro_diff_pct = 100.0 * gyro_diff / (abs(net_gyro_inner) + 1e-300)
+        return gyro_diff, gyro_diff_pct
 
 
 class OutputFormatter:
     """Formats analysis results for display"""
     
     @staticmethod
-    def format_analysis(result: Dict, verbose: bool = True) -> str:
-        """Format complete analysis as string"""
-        cond = result['condition']
-        output = []
-        
-        output.append(f"\n{'='*70}")
-        output.append(f"ANALYSIS: {cond.name}")
-        output.append(f"{'='*70}")
-        output.append(f"Conditions: {cond.speed_mph} mph, {cond.rpm} RPM, "
-                     f"{cond.lean_rate_rad_s:.1f} rad/s lean rate")
-        
-        if verbose:
-            output.append(f"\nWHEEL GYROSCOPIC TORQUE:")
-            output.append(f"  Front: {result['wheel_data']['front']:.2f} N⋅m "
-                         f"(ω = {result['wheel_data']['omega_front']:.1f} rad/s)")
-            output.append(f"  Rear:  {result['wheel_data']['rear']:.2f} N⋅m "
-                         f"(ω = {result['wheel_data']['omega_rear']:.1f} rad/s)")
-            output.append(f"  Total: {result['tau_wheels']:.2f} N⋅m")
-            
-            output.append(f"\nENGINE GYROSCOPIC TORQUE (opposite rotation):")
-            output.append(f"  Stock:  {result['engine_stock']['torque']:.2f} N⋅m "
-                         f"(I = {result['I_stock']:.6f} kg⋅m²)")
-            output.append(f"  Outer:  {result['engine_outer']['torque']:.2f} N⋅m "
-                         f"(I = {result['I_outer']:.6f} kg⋅m²)")
-            output.append(f"  Inner:  {result['engine_inner']['torque']:.2f} N⋅m "
-                         f"(I = {result['I_inner']:.6f} kg⋅m²)")
-            
-            output.append(f"\nNET GYROSCOPIC EFFECT (wheels - engine):")
-            output.append(f"  Stock:  {result['net_gyro_stock']:.2f} N⋅m")
-            output.append(f"  Outer:  {result['net_gyro_outer']:.2f} N⋅m")
-            output.append(f"  Inner:  {result['net_gyro_inner']:.2f} N⋅m")
-        
-        output.append(f"\n{'-'*70}")
-        output.append(f"GYRO HANDLING DIFFERENCE (Outer vs Inner):")
-        output.append(f"  Absolute difference: {result['gyro_diff']:.3f} N⋅m")
-        output.append(f"  Percentage difference: {result['gyro_diff_pct']:.2f}%")
+    def write_analysis(result: AnalysisResult, verbose: bool = True,
+                       out: Optional[TextIO] = None) -> None:
+        """Write complete analysis to a stream (stdout by default)"""
+        out = out if out is not None else sys.stdout
+        cond = result.condition
         
         # Perceptibility assessment
-        if result['gyro_diff_pct'] < 5:
-            status = "✅ NOT PERCEPTIBLE (< 5% threshold)"
-        elif result['gyro_diff_pct'] < 10:
-            status = "⚠️  BARELY PERCEPTIBLE (5-10% range)"
-        elif result['gyro_diff_pct'] < 20:
-            status = "⚠️  POSSIBLY PERCEPTIBLE (10-20% range)"
-        else:
-            status = "❌ LIKELY PERCEPTIBLE (> 20%)"
-        output.append(f"  Assessment: {status}")
-        
-        output.append(f"\n{'-'*70}")
-        output.append(f"ENGINE RESPONSE (Rotational Inertia):")
-        output.append(f"  Outer vs Inner difference: {result['inertia_diff_pct']:.1f}%")
-        output.append(f"  ✅ THIS IS VERY PERCEPTIBLE in throttle response!")
+        status = _STATUSES[bisect_right(_THRESHOLDS, result.gyro_diff_pct)]
         
-        return "\n".join(output)
+        out.write(f"""
+{'='*70}
+ANALYSIS: {cond.name}
+{'='*70}
+Conditions: {cond.speed_mph} mph, {cond.rpm} RPM, {cond.lean_rate_rad_s:.1f} rad/s lean rate
+""")
+        
+        if verbose:
+            out.write(f"""
+WHEEL GYROSCOPIC TORQUE:
+  Front: {result.wheel_data.front:.2f} N⋅m (ω = {result.wheel_data.omega_front:.1f} rad/s)
+  Rear:  {result.wheel_data.rear:.2f} N⋅m (ω = {result.wheel_data.omega_rear:.1f} rad/s)
+  Total: {result.tau_wheels:.2f} N⋅m
+
+ENGINE GYROSCOPIC TORQUE (opposite rotation):
+  Stock:  {result.engine_stock.torque:.2f} N⋅m (I = {result.I_stock:.6f} kg⋅m²)
+  Outer:  {result.engine_outer.torque:.2f} N⋅m (I = {result.I_outer:.6f} kg⋅m²)
+  Inner:  {result.engine_inner.torque:.2f} N⋅m (I = {result.I_inner:.6f} kg⋅m²)
+
+NET GYROSCOPIC EFFECT (wheels - engine):
+  Stock:  {result.net_gyro_stock:.2f} N⋅m
+  Outer:  {result.net_gyro_outer:.2f} N⋅m
+  Inner:  {result.net_gyro_inner:.2f} N⋅m
+""")
+        
+        out.write(f"""
+{'-'*70}
+GYRO HANDLING DIFFERENCE (Outer vs Inner):
+  Absolute difference: {result.gyro_diff:.3f} N⋅m
+  Percentage difference: {result.gyro_diff_pct:.2f}%
+  Assessment: {status}
+
+{'-'*70}
+ENGINE RESPONSE (Rotational Inertia):
+  Outer vs Inner difference: {result.inertia_diff_pct:.1f}%
+  ✅ THIS IS VERY PERCEPTIBLE in throttle response!
+""")
+    
+    @staticmethod
+    def format_analysis(result: AnalysisResult, verbose: bool = True) -> str:
+        """Format complete analysis as string"""
+        buf = io.StringIO()
+        OutputFormatter.write_analysis(result, verbose, buf)
+        # Drop the final newline, like the other format_* methods
+        return buf.getvalue()[:-1]
     
     @staticmethod
-    def format_summary_table(results: List[Dict]) -> str:
+    def format_summary_table(results: List[SummaryResult]) -> str:
         """Format summary comparison table"""
-        output = []
-        output.append(f"\n{'='*70}")
-        output.append("SUMMARY COMPARISON")
-        output.append(f"{'='*70}\n")
-        
-        # Header
-        output.append(f"{'Condition':<25} {'Net Gyro':>10}  {'Gyro Diff':>10}  {'Feel It?'}")
-        output.append(f"{'-'*70}")
-        
-        # Data rows
-        for r in results:
-            cond_name = r['condition'].name[:24]
-            perceptible = ("YES" if r['gyro_diff_pct'] >= 10 
-                          else "MAYBE" if r['gyro_diff_pct'] >= 5 
-                          else "NO")
-            output.append(f"{cond_name:<25} {r['net_gyro_outer']:>8.2f} N⋅m  "
-                         f"{r['gyro_diff_pct']:>8.2f}%  {perceptible}")
+        rows = "\n".join(
+            f"{r.condition.name[:24]:<25} {r.net_gyro_outer:>8.2f} N⋅m  "
+            f"{r.gyro_diff_pct:>8.2f}%  {r.perceptible}"
+            for r in results
+        )
+        return f"""
+{'='*70}
+SUMMARY COMPARISON
+{'='*70}
+
+{'Condition':<25} {'Net Gyro':>10}  {'Gyro Diff':>10}  {'Feel It?'}
+{'-'*70}
+{rows}"""
+    
+    @staticmethod
+    def write_sweep_csv(rpms: List[float], speeds_mph: List[float], grid: Iterable[List[float]],
+                        out: Optional[TextIO] = None) -> None:
+        """
+        Write a sweep grid as CSV: one row per RPM, one column per speed
         
-        return "\n".join(output)
+        Rows are written as the grid yields them. Grid points are written at full (repr) precision so they can be
+        reproduced exactly from the file.
+        """
+        writer = csv.writer(out if out is not None else sys.stdout, lineterminator="\n")
+        writer.writerow(["rpm\\speed_mph"] + [repr(v) for v in speeds_mph])
+        writer.writerows([repr(rpm)] + [f"{tau:.4f}" for tau in row]
+                         for rpm, row in zip(rpms, grid))
     
     @staticmethod
     def format_conclusion() -> str:
@@ -293,6 +504,15 @@ class OutputFormatter:
         return "\n".join(output)
 
 
+def linspace(lo: float, hi: float, n: int) -> List[float]:
+    """n evenly spaced values from lo to hi inclusive"""
+    if n == 1:
+        return [lo]
+    step = (hi - lo) / (n - 1)
+    # Pin the endpoint, as lo + (n-1)*step need not round to hi exactly
+    return [lo + i * step for i in range(n - 1)] + [hi]
+
+
 def create_default_conditions() -> List[RidingCondition]:
     """Create standard test conditions"""
     return [
@@ -322,6 +542,9 @@ Examples:
   
   # Custom bike parameters
   python gyro_analysis.py --flywheel-mass 1.5 --added-weight 14
+  
+  # Net gyro (outer placement) sweep as CSV
+  python gyro_analysis.py --sweep-rpm 3000 12000 10 --sweep-speed 5 60 12 --lean 2.0
         """
     )
     
@@ -345,6 +568,12 @@ Examples:
     parser.add_argument('--name', type=str, default='Custom Condition',
                        help='Name for custom condition')
     
+    # Sweep arguments
+    parser.add_argument('--sweep-rpm', type=float, nargs=3, metavar=('LO', 'HI', 'N'),
+                       help='Sweep RPM from LO to HI in N steps (requires --sweep-speed, --lean)')
+    parser.add_argument('--sweep-speed', type=float, nargs=3, metavar=('LO', 'HI', 'N'),
+                       help='Sweep speed in mph from LO to HI in N steps (requires --sweep-rpm, --lean)')
+    
     # Output options
     parser.add_argument('-q', '--quiet', action='store_true',
                        help='Show summary only, skip detailed output')
@@ -353,6 +582,16 @@ Examples:
     
     args = parser.parse_args()
     
+    sweep = args.sweep_rpm is not None or args.sweep_speed is not None
+    if sweep and (args.sweep_rpm is None or args.sweep_speed is None or args.lean is None):
+        parser.error("--sweep-rpm, --sweep-speed and --lean must be given together")
+    if sweep and (args.speed is not None or args.rpm is not None or args.quiet
+                  or args.name != parser.get_default('name')):
+        parser.error("--speed, --rpm, --name and --quiet cannot be used with a sweep")
+    for opt, values in (('--sweep-rpm', args.sweep_rpm), ('--sweep-speed', args.sweep_speed)):
+        if values is not None and (values[2] < 1 or not values[2].is_integer()):
+            parser.error(f"{opt}: N must be a positive integer")
+    
     # Create bike configuration
     config = BikeConfig(
         stock_flywheel_mass=args.flywheel_mass,
@@ -365,6 +604,14 @@ Examples:
     analyzer = GyroscopicAnalyzer(config)
     formatter = OutputFormatter()
     
+    # Sweep mode writes only the CSV grid
+    if sweep:
+        rpms = linspace(args.sweep_rpm[0], args.sweep_rpm[1], int(args.sweep_rpm[2]))
+        speeds = linspace(args.sweep_speed[0], args.sweep_speed[1], int(args.sweep_speed[2]))
+        grid = analyzer.sweep_net_gyro(rpms, speeds, args.lean)
+        formatter.write_sweep_csv(rpms, speeds, grid)
+        return
+    
     # Determine conditions to analyze
     if args.speed and args.rpm and args.lean:
         conditions = [RidingCondition(args.name, args.speed, args.rpm, args.lean)]
@@ -382,13 +629,13 @@ Examples:
     print(f"  Inner radius: {config.inner_radius*1000:.0f} mm")
     
     # Run analyses
-    results = []
-    for condition in conditions:
-        result = analyzer.analyze_condition(condition)
-        results.append(result)
-        
-        if not args.quiet:
-            print(formatter.format_analysis(result, verbose=not args.quiet))
+    if args.quiet:
+        # The summary table only needs the minimal results
+        results = analyzer.analyze_conditions(conditions, full=False)
+    else:
+        results = analyzer.analyze_conditions(conditions)
+        for result in results:
+            formatter.write_analysis(result)
     
     # Print summary
     print(formatter.format_summary_table(results))